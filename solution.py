@@ -1,148 +1,236 @@
 import re
-from functools import total_ordering
+import sys
+from functools import lru_cache
+
+PATTERN = (
+    r"^(?P<major>0|[1-9]\d*)\."
+    r"(?P<minor>0|[1-9]\d*)\."
+    r"(?P<patch>0|[1-9]\d*)"
+    r"(?:-"
+    r"(?P<prerelease>"
+    r"(?:0|[1-9]\d*|[A-Za-z-][0-9A-Za-z-]*)"
+    r"(?:\.(?:0|[1-9]\d*|[A-Za-z-][0-9A-Za-z-]*))*"
+    r")"
+    r")?"
+    r"(?:\+"
+    r"(?P<build>"
+    r"[0-9A-Za-z-]+"
+    r"(?:\.[0-9A-Za-z-]+)*"
+    r")"
+    r")?\Z"
+)
+
+COMPATIBILITY_MODE = (
+    r"^(?P<major>0|[1-9]\d*)\."
+    r"(?P<minor>0|[1-9]\d*)\."
+    r"(?P<patch>0|[1-9]\d*)"
+    r"(?:(?P<prerelease>"
+    r"(?:rc|[a-zA-Z])\d*"
+    r"))?\Z"
+)
+
+_COMPAT = re.compile(COMPATIBILITY_MODE)
+
+_ALNUM_HYPHEN = frozenset(
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-"
+)
+_ALPHA_HYPHEN = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz-")
+
+
+def _is_numeric_identifier(part):
+    """Return true if part is a numeric identifier without leading zeros."""
+    return part.isascii() and part.isdigit() and (part == "0" or part[0] != "0")
+
+
+def _is_prerelease_identifier(part):
+    """Return true if part is a valid prerelease identifier."""
+    return bool(part) and (
+        _is_numeric_identifier(part)
+        or (part[0] in _ALPHA_HYPHEN and _ALNUM_HYPHEN.issuperset(part))
+    )
+
+
+def _is_build_identifier(part):
+    """Return true if part is a valid build-metadata identifier."""
+    return bool(part) and _ALNUM_HYPHEN.issuperset(part)
 
 
-@total_ordering
 class Version:
     """Represents a semantic version and provides comparison operators."""
 
-    PATTERN = (
-        r"^(?P<major>0|[1-9]\d*)\."
-        r"(?P<minor>0|[1-9]\d*)\."
-        r"(?P<patch>0|[1-9]\d*)"
-        r"(?:-"
-        r"(?P<prerelease>"
-        r"(?:0|[1-9]\d*|[A-Za-z-][0-9A-Za-z-]*)"
-        r"(?:\.(?:0|[1-9]\d*|[A-Za-z-][0-9A-Za-z-]*))*"
-        r")"
-        r")?"
-        r"(?:\+"
-        r"(?P<build>"
-        r"[0-9A-Za-z-]+"
-        r"(?:\.[0-9A-Za-z-]+)*"
-        r")"
-        r")?$"
+    __slots__ = (
+        "major",
+        "minor",
+        "patch",
+        "prerelease",
+        "build",
+        "_core",
+        "_pre_key",
+        "_key",
+        "_hash",
     )
 
-    COMPATIBILITY_MODE = (
-        r"^(?P<major>0|[1-9]\d*)\."
-        r"(?P<minor>0|[1-9]\d*)\."
-        r"(?P<patch>0|[1-9]\d*)"
-        r"(?:(?P<prerelease>"
-        r"(?:rc|[a-zA-Z])\d*"
-        r"))?$"
-    )
+    def _parse_strict(self, version):
+        """Parse a strict semantic version with string methods; return success."""
+        core, plus, build = version.partition("+")
+        core, dash, prerelease = core.partition("-")
 
-    def _set_values(self, match, comp_match):
-        """Set Version values depending on which regex is matched."""
-        if match:
-            self.major = int(match.group("major"))
-            self.minor = int(match.group("minor"))
-            self.patch = int(match.group("patch"))
-            self.prerelease = match.group("prerelease")
-            self.build = match.group("build")
-        else:
-            self.major = int(comp_match.group("major"))
-            self.minor = int(comp_match.group("minor"))
-            self.patch = int(comp_match.group("patch"))
-            self.prerelease = comp_match.group("prerelease")
-            self.build = None
+        core_parts = core.split(".")
+        if len(core_parts) != 3 or not all(
+            _is_numeric_identifier(part) for part in core_parts
+        ):
+            return False
+        if dash and not all(
+            _is_prerelease_identifier(part) for part in prerelease.split(".")
+        ):
+            return False
+        if plus and not all(
+            _is_build_identifier(part) for part in build.split(".")
+        ):
+            return False
+
+        self.major, self.minor, self.patch = map(int, core_parts)
+        self.prerelease = sys.intern(prerelease) if dash else None
+        self.build = build if plus else None
+        return True
+
+    def _set_compat_values(self, comp_match):
+        """Set Version values from a compatibility-mode match."""
+        self.major = int(comp_match.group("major"))
+        self.minor = int(comp_match.group("minor"))
+        self.patch = int(comp_match.group("patch"))
+        self.prerelease = comp_match.group("prerelease")
+        self.build = None
 
-        if self.prerelease and not match:
-            self.prerelease = self._normalize_prerelease(self.prerelease)
+        if self.prerelease:
+            self.prerelease = sys.intern(self._normalize_prerelease(self.prerelease))
 
     @staticmethod
     def _normalize_prerelease(prerelease_str):
         """Convert shorthand prerelease (e.g., 'b1') into a normalized form (e.g., 'b-1')."""
-        m = re.match(r"^(rc|[a-zA-Z])(\d*)$", prerelease_str)
-        if m:
-            prefix, number = m.groups()
-            if number:
-                return f"{prefix}-{int(number)}"
-            return prefix
-        return prerelease_str
+        i = len(prerelease_str)
+        while i and prerelease_str[i - 1].isdigit():
+            i -= 1
+        prefix, number = prerelease_str[:i], prerelease_str[i:]
+
+        if prefix != "rc" and not (len(prefix) == 1 and prefix.isalpha()):
+            return prerelease_str
+        if number:
+            return f"{prefix}-{int(number)}"
+        return prefix
 
     def __init__(self, version):
         """Initialize the Version instance from a version string."""
-        match = re.match(self.PATTERN, version)
-        comp_match = re.match(self.COMPATIBILITY_MODE, version)
-
-        if not match and not comp_match:
-            raise ValueError(f"'{version}' is not a valid semantic version.")
-
-        self.major = None
-        self.minor = None
-        self.patch = None
-        self.prerelease = None
-        self.build = None
-        self.version = version
-
-        self._set_values(match, comp_match)
+        if not self._parse_strict(version):
+            comp_match = _COMPAT.match(version)
+            if comp_match is None:
+                raise ValueError(f"'{version}' is not a valid semantic version.")
+            self._set_compat_values(comp_match)
+
+        self._core = (self.major, self.minor, self.patch)
+        if self.prerelease:
+            self._pre_key = tuple(
+                (0, int(part)) if part.isdigit() else (1, part)
+                for part in self.prerelease.split(".")
+            )
+        else:
+            # A release outranks any prerelease; 2 sorts above the 0/1
+            # tags used for numeric and alphanumeric identifiers.
+            self._pre_key = ((2,),)
+        self._key = (self._core, self._pre_key)
+        self._hash = hash(self._key)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def parse(cls, version):
+        """Return a Version for the string, reusing instances for repeated parses."""
+        return cls(version)
+
+    @classmethod
+    def sort(cls, strings):
+        """Sort version strings ascending, parsing each distinct string once."""
+        return sorted(strings, key=cls.parse)
 
     def compare_core(self, other):
         """Compare the core version (major, minor, patch) parts."""
-        for self_part, other_part in zip(
-            [self.major, self.minor, self.patch],
-            [other.major, other.minor, other.patch],
-        ):
-            if self_part < other_part:
-                return -1
-            if self_part > other_part:
-                return 1
-        return 0
+        a, b = self._core, other._core
+        return (a > b) - (a < b)
 
     def compare_prerelease(self, other):
         """Compare the prerelease parts of two versions."""
-        if self.prerelease and not other.prerelease:
-            return -1
-        if not self.prerelease and other.prerelease:
-            return 1
-        if not self.prerelease and not other.prerelease:
+        if self.prerelease is other.prerelease:
             return 0
 
-        id1_parts = self.prerelease.split(".")
-        id2_parts = other.prerelease.split(".")
-        for id1, id2 in zip(id1_parts, id2_parts):
-            is_num1 = id1.isdigit()
-            is_num2 = id2.isdigit()
-
-            if is_num1 and is_num2:
-                if int(id1) < int(id2):
-                    return -1
-                if int(id1) > int(id2):
-                    return 1
-            elif not is_num1 and not is_num2:
-                if id1 < id2:
-                    return -1
-                if id1 > id2:
-                    return 1
-            elif is_num1 and not is_num2:
-                return -1
-            elif is_num2 and not is_num1:
-                return 1
-
-        if len(id1_parts) < len(id2_parts):
-            return -1
-        if len(id1_parts) > len(id2_parts):
-            return 1
-        return 0
+        a, b = self._pre_key, other._pre_key
+        return (a > b) - (a < b)
 
     def __lt__(self, other):
         """Return true if version is less than the other."""
-        core_cmp = self.compare_core(other)
-        if core_cmp == -1:
-            return True
-        if core_cmp == 1:
-            return False
+        return self._key < other._key
+
+    def __le__(self, other):
+        """Return true if version is less than or equal to the other."""
+        return self._key <= other._key
 
-        pre_cmp = self.compare_prerelease(other)
-        return pre_cmp == -1
+    def __gt__(self, other):
+        """Return true if version is greater than the other."""
+        return self._key > other._key
+
+    def __ge__(self, other):
+        """Return true if version is greater than or equal to the other."""
+        return self._key >= other._key
 
     def __eq__(self, other):
         """Return true if versions are equal."""
-        return (
-            self.compare_core(other) == 0
-            and self.compare_prerelease(other) == 0
+        if self is other:
+            return True
+        return self._key == other._key
+
+    def __ne__(self, other):
+        """Return true if versions are not equal."""
+        return self._key != other._key
+
+    def __hash__(self):
+        """Return the precomputed hash of the comparison key."""
+        return self._hash
+
+    def __repr__(self):
+        """Reconstruct the version string from the parsed fields."""
+        version = f"{self.major}.{self.minor}.{self.patch}"
+        if self.prerelease:
+            version += f"-{self.prerelease}"
+        if self.build:
+            version += f"+{self.build}"
+        return version
+
+
+class VersionArray:
+    """Column-oriented (struct-of-arrays) storage for a batch of versions."""
+
+    __slots__ = ("majors", "minors", "patches", "pre_keys")
+
+    def __init__(self, strings):
+        """Parse the strings into parallel per-field columns."""
+        versions = [Version(s) for s in strings]
+        self.majors = [v.major for v in versions]
+        self.minors = [v.minor for v in versions]
+        self.patches = [v.patch for v in versions]
+        self.pre_keys = [v._pre_key for v in versions]
+
+    def __len__(self):
+        return len(self.majors)
+
+    def argsort(self):
+        """Return the indices that order the stored versions ascending."""
+        majors, minors, patches, pre_keys = (
+            self.majors,
+            self.minors,
+            self.patches,
+            self.pre_keys,
+        )
+        return sorted(
+            range(len(majors)),
+            key=lambda i: (majors[i], minors[i], patches[i], pre_keys[i]),
         )
 
 